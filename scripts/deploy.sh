@@ -37,28 +37,46 @@ docker-compose down
 echo -e "${YELLOW}🏃 Starting services...${NC}"
 docker-compose up -d
 
-# Wait for services to be ready
-echo -e "${YELLOW}⏳ Waiting for services to start...${NC}"
-sleep 15
-
-# Health check
+# Health check (polls until the service is ready)
+# The final probe lands at max_wait, so startup gets at least as long as the
+# previous fixed 15s wait + 12x5s polling (last probe at ~70s).
 echo -e "${YELLOW}🏥 Performing health check...${NC}"
-max_attempts=12
+max_wait=75
+max_delay=10
+delay=1
 attempt=1
+healthy=false
+start=$SECONDS
+deadline=$((start + max_wait))
 
-while [ $attempt -le $max_attempts ]; do
-    if curl -f http://localhost:$IPSW_PORT/health > /dev/null 2>&1; then
+while true; do
+    if curl -fsS --max-time 5 http://localhost:$IPSW_PORT/health > /dev/null 2>&1; then
         echo -e "${GREEN}✅ Health check passed!${NC}"
+        healthy=true
+        break
+    fi
+
+    # Never sleep past the deadline; the probe after the last sleep is the final one
+    remaining=$((deadline - SECONDS))
+    if [ $remaining -le 0 ]; then
         break
-    else
-        echo -e "${YELLOW}⏳ Attempt $attempt/$max_attempts - waiting for service...${NC}"
-        sleep 5
-        ((attempt++))
+    fi
+    wait_for=$delay
+    if [ $wait_for -gt $remaining ]; then
+        wait_for=$remaining
+    fi
+
+    echo -e "${YELLOW}⏳ Attempt $attempt - waiting ${wait_for}s for service...${NC}"
+    sleep $wait_for
+    ((attempt++))
+    delay=$((delay * 2))
+    if [ $delay -gt $max_delay ]; then
+        delay=$max_delay
     fi
 done
 
-if [ $attempt -gt $max_attempts ]; then
-    echo -e "${RED}❌ Health check failed after $max_attempts attempts${NC}"
+if [ "$healthy" != true ]; then
+    echo -e "${RED}❌ Health check failed after $((SECONDS - start))s ($attempt attempts)${NC}"
     echo -e "${YELLOW}📋 Container logs:${NC}"
     docker-compose logs --tail=20 ipsw
     exit 1